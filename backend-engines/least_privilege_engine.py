@@ -21,6 +21,7 @@ This engine implements:
 6. Continuous drift detection
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Set
 from enum import Enum
@@ -83,6 +84,13 @@ HIGH_RISK_PATTERNS = [
     "*:*",
 ]
 
+# Literal fragments of each pattern, split on "*" once at import.
+# A permission matches when it contains every fragment.
+_HIGH_RISK_PARTS = [
+    (pattern, tuple(part for part in pattern.split("*") if part))
+    for pattern in HIGH_RISK_PATTERNS
+]
+
 
 # Confidence scoring weights
 CONFIDENCE_WEIGHTS = {
@@ -278,8 +286,8 @@ class LeastPrivilegeEngine:
         reasons = []
         
         # Check against high-risk patterns
-        for pattern in HIGH_RISK_PATTERNS:
-            if self._matches_pattern(permission, pattern):
+        for pattern, parts in _HIGH_RISK_PARTS:
+            if self._matches_pattern(permission, parts):
                 reasons.append(f"Matches high-risk pattern: {pattern}")
         
         # Wildcard resource
@@ -299,17 +307,10 @@ class LeastPrivilegeEngine:
         return level.value, reasons
     
     
-    def _matches_pattern(self, permission: str, pattern: str) -> bool:
-        """Check if permission matches a risk pattern"""
-        if "*" in pattern:
-            # Simple wildcard matching
-            pattern_parts = pattern.split("*")
-            if all(part in permission for part in pattern_parts if part):
-                return True
-        else:
-            if pattern in permission:
-                return True
-        return False
+    def _matches_pattern(self, permission: str, pattern_parts: tuple) -> bool:
+        """Check if permission matches a risk pattern (see _HIGH_RISK_PARTS)"""
+        # Simple wildcard matching; a pattern without "*" is one substring
+        return all(part in permission for part in pattern_parts)
     
     
     def _classify_by_usage(
@@ -488,16 +489,17 @@ class LeastPrivilegeEngine:
         if not permissions:
             return 100.0
         
-        active_required = sum(1 for p in permissions if p.status == PermissionStatus.ACTIVE_REQUIRED.value)
-        inactive_safe = sum(1 for p in permissions if p.status == PermissionStatus.INACTIVE_SAFE.value)
+        # Count every status in one pass
+        counts = Counter(p.status for p in permissions)
+        active_required = counts[PermissionStatus.ACTIVE_REQUIRED.value]
         
         # Perfect score if all permissions are either actively required or safely inactive
         # Low score if many permissions are anomalous or potentially needed
         score = (active_required / len(permissions)) * 100.0
         
         # Penalty for inactive permissions that are NOT safe to remove
-        inactive_needed = sum(1 for p in permissions if p.status == PermissionStatus.INACTIVE_NEEDED.value)
-        anomalous = sum(1 for p in permissions if p.status == PermissionStatus.ACTIVE_ANOMALOUS.value)
+        inactive_needed = counts[PermissionStatus.INACTIVE_NEEDED.value]
+        anomalous = counts[PermissionStatus.ACTIVE_ANOMALOUS.value]
         
         penalty = ((inactive_needed + anomalous) / len(permissions)) * 20.0
         
@@ -520,39 +522,36 @@ class LeastPrivilegeEngine:
         safe_to_remove = [p for p in permissions if p.status == PermissionStatus.INACTIVE_SAFE.value]
         
         if safe_to_remove:
-            # Group by risk level
-            critical_unused = [p for p in safe_to_remove if p.risk_level == RiskLevel.CRITICAL.value]
-            high_unused = [p for p in safe_to_remove if p.risk_level == RiskLevel.HIGH.value]
-            other_unused = [p for p in safe_to_remove if p.risk_level not in [RiskLevel.CRITICAL.value, RiskLevel.HIGH.value]]
+            # Critical first, then high - same order as listing them separately
+            high_risk_unused = (
+                [p for p in safe_to_remove if p.risk_level == RiskLevel.CRITICAL.value] +
+                [p for p in safe_to_remove if p.risk_level == RiskLevel.HIGH.value]
+            )
             
             # Recommendation for critical/high risk removals
-            if critical_unused or high_unused:
+            if high_risk_unused:
+                confidence = self._avg_confidence(high_risk_unused)
                 recommendations.append({
                     "id": f"{identity_id}-remove-high-risk",
                     "type": "REMOVE",
                     "priority": "HIGH",
-                    "permissions_to_remove": [p.action for p in critical_unused + high_unused],
-                    "impact": f"Removes {len(critical_unused + high_unused)} high-risk unused permissions",
-                    "confidence": self._avg_confidence(critical_unused + high_unused),
-                    "recommended_action": self._determine_action(
-                        self._avg_confidence(critical_unused + high_unused),
-                        system_context
-                    )
+                    "permissions_to_remove": [p.action for p in high_risk_unused],
+                    "impact": f"Removes {len(high_risk_unused)} high-risk unused permissions",
+                    "confidence": confidence,
+                    "recommended_action": self._determine_action(confidence, system_context)
                 })
             
             # Recommendation for all removals
             if len(safe_to_remove) >= 5:
+                confidence = self._avg_confidence(safe_to_remove)
                 recommendations.append({
                     "id": f"{identity_id}-remove-all-unused",
                     "type": "REMOVE",
                     "priority": "MEDIUM",
                     "permissions_to_remove": [p.action for p in safe_to_remove],
                     "impact": f"Removes {len(safe_to_remove)} unused permissions, reduces attack surface by {(len(safe_to_remove)/len(permissions)*100):.0f}%",
-                    "confidence": self._avg_confidence(safe_to_remove),
-                    "recommended_action": self._determine_action(
-                        self._avg_confidence(safe_to_remove),
-                        system_context
-                    )
+                    "confidence": confidence,
+                    "recommended_action": self._determine_action(confidence, system_context)
                 })
         
         # Check for anomalous usage
@@ -878,7 +877,8 @@ class SnapshotManager:
         Returns:
             Snapshot metadata with ID and checksum
         """
-        snapshot_id = self._generate_snapshot_id(identity_arn)
+        timestamp = datetime.utcnow().isoformat()
+        snapshot_id = self._generate_snapshot_id(identity_arn, timestamp)
         
         snapshot_data = {
             "id": snapshot_id,
@@ -887,7 +887,7 @@ class SnapshotManager:
             "iam_policies": iam_policies,
             "trust_policy": trust_policy,
             "metadata": metadata,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": timestamp + "Z",
             "version": "1.0"
         }
         
@@ -898,9 +898,8 @@ class SnapshotManager:
         return snapshot_data
     
     
-    def _generate_snapshot_id(self, identity_arn: str) -> str:
+    def _generate_snapshot_id(self, identity_arn: str, timestamp: str) -> str:
         """Generate unique snapshot ID"""
-        timestamp = datetime.utcnow().isoformat()
         combined = f"{identity_arn}:{timestamp}"
         return hashlib.sha256(combined.encode()).hexdigest()[:16]
     
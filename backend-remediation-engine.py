@@ -14,14 +14,27 @@ USAGE:
 """
 
 import json
-import uuid
+import os
+import time
+import threading
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from enum import Enum
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
+try:
+    import orjson  # Optional: faster policy document encoding
+except ImportError:
+    orjson = None
+
 router = APIRouter()
 
 # ============================================================================
@@ -42,9 +55,114 @@ class FindingStatus(str, Enum):
 # IN-MEMORY STORAGE (Replace with DynamoDB/Redis for production)
 # ============================================================================
 
-_simulations: Dict[str, Dict] = {}
-_executions: Dict[str, Dict] = {}
-_snapshots: Dict[str, Dict] = {}
+# Sentinel for "no entry"; stored values may legitimately be None
+_MISSING = object()
+
+
+class BoundedStore(MutableMapping):
+    """
+    Mapping with LRU eviction and optional TTL.
+
+    Keeps a long-running worker's memory flat: once maxsize is reached the
+    least recently used entry is dropped, and entries older than ttl
+    seconds read as missing. Iteration, len(), keys(), values() and items()
+    only see entries that have not expired.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if self._expired(expires_at):
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            value, expires_at = self._data.pop(key)
+        if self._expired(expires_at):
+            raise KeyError(key)
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        if item is None or self._expired(item[1]):
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return item[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate a snapshot so callers can modify the store as they go
+        with self._lock:
+            self._purge_expired()
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired()
+            return len(self._data)
+
+    def items(self) -> List[tuple]:
+        with self._lock:
+            self._purge_expired()
+            return [(key, value) for key, (value, _) in self._data.items()]
+
+    def values(self) -> List[Any]:
+        with self._lock:
+            self._purge_expired()
+            return [value for value, _ in self._data.values()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    @staticmethod
+    def _expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at < time.monotonic()
+
+    def _purge_expired(self) -> None:
+        # Caller holds the lock
+        expired = [key for key, (_, expires_at) in self._data.items() if self._expired(expires_at)]
+        for key in expired:
+            del self._data[key]
+
+
+# execute_remediation only reads _simulations; nothing in this module writes
+# it, so it is filled by whichever simulate route your main.py wires up.
+# Simulations a user never executes would otherwise pile up
+_simulations = BoundedStore(maxsize=10_000, ttl=3600)
+# Executions and their snapshots never expire: a snapshot is the only way to
+# roll back a destructive change, so only the size cap drops them
+_executions = BoundedStore(maxsize=10_000)
+_snapshots = BoundedStore(maxsize=10_000)
 _finding_status: Dict[str, FindingStatus] = {}
 
 
@@ -74,37 +192,122 @@ class RollbackRequest(BaseModel):
     finding_id: Optional[str] = None
 
 
+# ============================================================================
+# AWS CLIENTS - Shared across requests
+# ============================================================================
+
+_iam_client = None
+_iam_client_lock = threading.Lock()
+
+# Shared pool for fanning out independent IAM calls (boto3 clients are
+# thread-safe). Only submit from request threads, never from pool tasks.
+_iam_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="iam")
+
+# IAM mutations are throttled far harder than reads and fail with
+# ConcurrentModification when they race on one entity, so writes get a
+# small pool of their own and a retry with exponential backoff.
+_iam_write_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="iam-write")
+IAM_WRITE_RETRIES = 5
+IAM_WRITE_BACKOFF_SECONDS = 0.1
+
+
+def _new_id(prefix: str) -> str:
+    """Random ID like snap-1a2b3c4d5e6f (48 random bits as 12 hex chars)."""
+    return f"{prefix}-{os.urandom(6).hex()}"
+
+
+def extract_role_name(role_arn: str) -> str:
+    """
+    Role name from a role ARN. The name is the last path segment, so
+    arn:aws:iam::123:role/service-role/app gives 'app'.
+    """
+    return role_arn.rsplit('/', 1)[-1]
+
+
+def _policy_json(document: Dict) -> str:
+    """Serialize an IAM policy document for put/create calls (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(document).decode('utf-8')
+    return json.dumps(document)
+
+
+def _retry_concurrent_modification(call, **kwargs):
+    """
+    Run an IAM mutation, retrying with exponential backoff (0.1s, 0.2s,
+    0.4s, ...) while IAM reports ConcurrentModification.
+    """
+    delay = IAM_WRITE_BACKOFF_SECONDS
+    for attempt in range(IAM_WRITE_RETRIES + 1):
+        try:
+            return call(**kwargs)
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code != 'ConcurrentModification' or attempt == IAM_WRITE_RETRIES:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
+def get_iam_client():
+    """
+    Return the process-wide IAM client, creating it on first use.
+
+    Building a client loads the service model and a fresh connection pool,
+    so it is done once; the pool is sized above _iam_pool's worker count
+    so concurrent fan-out doesn't queue on connections. Keepalive holds
+    idle connections open between requests, and adaptive retries back off
+    client-side when IAM starts throttling the fan-out.
+    """
+    global _iam_client
+    if _iam_client is None:
+        with _iam_client_lock:
+            if _iam_client is None:
+                _iam_client = boto3.session.Session().client(
+                    'iam',
+                    config=Config(
+                        max_pool_connections=32,
+                        tcp_keepalive=True,
+                        retries={'max_attempts': 5, 'mode': 'adaptive'}
+                    )
+                )
+    return _iam_client
+
+
 # ============================================================================
 # SNAPSHOT MANAGER - Captures state before changes
 # ============================================================================
 
+
 class SnapshotManager:
     """Creates snapshots of AWS resources before modification"""
 
     @staticmethod
     def create_iam_snapshot(resource_id: str) -> Dict:
         """Snapshot an IAM role/policy before modification"""
-        snapshot_id = f"snap-{uuid.uuid4().hex[:12]}"
+        snapshot_id = _new_id("snap")
 
         try:
-            iam = boto3.client('iam')
+            iam = get_iam_client()
 
             # Determine if it's a role or policy
             if ':role/' in resource_id:
-                role_name = resource_id.split('/')[-1]
-
-                # Get role details
-                role = iam.get_role(RoleName=role_name)['Role']
+                role_name = extract_role_name(resource_id)
 
-                # Get attached policies
-                attached = iam.list_attached_role_policies(RoleName=role_name)
+                # Role details and attached policies don't depend on the
+                # inline listing, so fetch them while it runs
+                role_future = _iam_pool.submit(iam.get_role, RoleName=role_name)
+                attached_future = _iam_pool.submit(iam.list_attached_role_policies, RoleName=role_name)
 
-                # Get inline policies
+                # Get inline policies, one concurrent get_role_policy per name
                 inline_names = iam.list_role_policies(RoleName=role_name)['PolicyNames']
-                inline_policies = {}
-                for name in inline_names:
-                    doc = iam.get_role_policy(RoleName=role_name, PolicyName=name)
-                    inline_policies[name] = doc['PolicyDocument']
+                docs = _iam_pool.map(
+                    lambda name: iam.get_role_policy(RoleName=role_name, PolicyName=name)['PolicyDocument'],
+                    inline_names
+                )
+                inline_policies = dict(zip(inline_names, docs))
+
+                role = role_future.result()['Role']
+                attached = attached_future.result()
 
                 snapshot = {
                     'snapshot_id': snapshot_id,
@@ -171,19 +374,29 @@ class SnapshotManager:
             raise ValueError(f"Snapshot {snapshot_id} not found")
 
         try:
-            iam = boto3.client('iam')
+            iam = get_iam_client()
 
             if snapshot['resource_type'] == 'IAM_ROLE':
                 role_name = snapshot['role_name']
 
-                # Restore inline policies
-                for name, doc in snapshot.get('inline_policies', {}).items():
-                    iam.put_role_policy(
+                # Restore inline policies concurrently. Documents are
+                # serialized up front so a retried put doesn't re-encode.
+                restores = [
+                    (name, _policy_json(doc))
+                    for name, doc in snapshot.get('inline_policies', {}).items()
+                ]
+
+                def put_policy(item):
+                    name, document = item
+                    _retry_concurrent_modification(
+                        iam.put_role_policy,
                         RoleName=role_name,
                         PolicyName=name,
-                        PolicyDocument=json.dumps(doc)
+                        PolicyDocument=document
                     )
 
+                list(_iam_write_pool.map(put_policy, restores))
+
                 return {
                     'success': True,
                     'message': f'Restored role {role_name} from snapshot',
@@ -197,7 +410,7 @@ class SnapshotManager:
                 # Create new version with original policy
                 iam.create_policy_version(
                     PolicyArn=policy_arn,
-                    PolicyDocument=json.dumps(policy_doc),
+                    PolicyDocument=_policy_json(policy_doc),
                     SetAsDefault=True
                 )
 
@@ -229,22 +442,39 @@ class ExecutionEngine:
     """Executes remediation actions against AWS"""
 
     @staticmethod
-    def remove_unused_permissions(resource_id: str, permissions_to_remove: List[str]) -> Dict:
-        """Remove specific permissions from an IAM policy - FOR DEMO: Delete entire inline policy"""
+    def remove_unused_permissions(
+        resource_id: str,
+        permissions_to_remove: List[str],
+        inline_policy_names: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Remove specific permissions from an IAM policy - FOR DEMO: Delete entire inline policy
+
+        inline_policy_names, when given, is the role's inline policy listing
+        from a snapshot taken just before this call and saves re-listing it.
+        """
         try:
-            iam = boto3.client('iam')
+            iam = get_iam_client()
 
             if ':role/' in resource_id:
-                role_name = resource_id.split('/')[-1]
+                role_name = extract_role_name(resource_id)
 
-                # Get current inline policies
-                inline_names = iam.list_role_policies(RoleName=role_name)['PolicyNames']
+                # Get current inline policies (unless the snapshot already did)
+                inline_names = inline_policy_names
+                if inline_names is None:
+                    inline_names = iam.list_role_policies(RoleName=role_name)['PolicyNames']
 
-                deleted_policies = []
-                for policy_name in inline_names:
+                def delete_policy(policy_name):
                     # DELETE THE ENTIRE POLICY (for demo roles that are 100% unused)
-                    iam.delete_role_policy(RoleName=role_name, PolicyName=policy_name)
-                    deleted_policies.append(policy_name)
+                    _retry_concurrent_modification(
+                        iam.delete_role_policy,
+                        RoleName=role_name,
+                        PolicyName=policy_name
+                    )
+                    return policy_name
+
+                # Deletes are independent, so issue them concurrently
+                deleted_policies = list(_iam_write_pool.map(delete_policy, inline_names))
 
                 return {
                     'success': True,
@@ -287,7 +517,7 @@ async def execute_remediation(request: ExecuteRequest):
     3. Calls AWS to make actual changes
     4. Updates status to REMEDIATED or FAILED
     """
-    execution_id = f"exec-{uuid.uuid4().hex[:12]}"
+    execution_id = _new_id("exec")
     snapshot_id = None
 
     try:
@@ -295,9 +525,12 @@ async def execute_remediation(request: ExecuteRequest):
         _finding_status[request.finding_id] = FindingStatus.EXECUTING
 
         # Create snapshot before changes
+        inline_policy_names = None
         if request.create_rollback and request.resource_id:
-            snapshot = SnapshotManager.create_iam_snapshot(request.resource_id)
+            snapshot = await run_in_threadpool(SnapshotManager.create_iam_snapshot, request.resource_id)
             snapshot_id = snapshot['snapshot_id']
+            if 'inline_policies' in snapshot:
+                inline_policy_names = list(snapshot['inline_policies'])
 
         # Get simulation data if available
         simulation = None
@@ -316,19 +549,22 @@ async def execute_remediation(request: ExecuteRequest):
         result = {'success': True, 'demo_mode': True}  # Default for demo
 
         if request.resource_id:
-            result = ExecutionEngine.remove_unused_permissions(
+            result = await run_in_threadpool(
+                ExecutionEngine.remove_unused_permissions,
                 request.resource_id,
-                permissions_to_remove
+                permissions_to_remove,
+                inline_policy_names
             )
 
-        # Store execution record
+        # Store execution record (stamped once, shared with the response)
+        timestamp = datetime.utcnow().isoformat()
         execution = {
             'execution_id': execution_id,
             'finding_id': request.finding_id,
             'snapshot_id': snapshot_id,
             'status': 'REMEDIATED' if result.get('success') else 'FAILED',
             'result': result,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp
         }
         _executions[execution_id] = execution
 
@@ -346,7 +582,7 @@ async def execute_remediation(request: ExecuteRequest):
             'status': 'executed',
             'message': 'Remediation applied successfully',
             'details': result,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp
         }
 
     except Exception as e:
@@ -384,7 +620,7 @@ async def rollback_execution(request: RollbackRequest):
             raise HTTPException(status_code=400, detail="No snapshot_id available for rollback")
 
         # Restore from snapshot
-        result = SnapshotManager.restore_snapshot(snapshot_id)
+        result = await run_in_threadpool(SnapshotManager.restore_snapshot, snapshot_id)
 
         if result.get('success'):
             # Update finding status
@@ -240,6 +240,78 @@ class DecisionEngine:
         return reasons
 
 
+# ============================================================================
+# SIMULATE CONTEXT
+# Static until the endpoint is wired to real sources (see TODO in simulate_fix).
+# Built once at import so requests don't re-allocate identical dicts; the
+# engine only reads these, never mutates them.
+# ============================================================================
+
+# Simulation result (mock data for now)
+SIMULATION_DATA = {
+    "status": "SAFE",
+    "reachability_preserved": 0.94,
+    "critical_path_affected": False,
+    "worst_path_severity": 0.1,
+    "permissions_tested": 15,
+    "permissions_safe": 14,
+    "services_tested": ["api-gateway", "lambda", "dynamodb"],
+    "warnings": [
+        "External monitoring service may lose read access",
+        "Verify no automated scripts rely on this permission"
+    ]
+}
+
+# Context data
+USAGE_DATA = {
+    "days_since_last_use": 120,
+    "usage_count_90d": 0,
+    "observation_days": 90,
+    "sources_available": 3,
+    "usage_pattern": "NONE",
+    "last_used_by": None
+}
+
+GRAPH_DATA = {
+    "total_resources": 5,
+    "resources_with_telemetry": 5,
+    "edges_observed": 8,
+    "edges_estimated": 10,
+    "impacted_services": [],
+    "cross_account_dependencies": 0,
+    "circular_dependencies": False
+}
+
+HISTORY_DATA = {
+    "total": 23,
+    "successes": 23,
+    "rollbacks": 0,
+    "similar_resource_type_success_rate": 1.0,
+    "last_failure_days_ago": None
+}
+
+ENV_DATA = {
+    "tier": 2,  # development
+    "region": "us-east-1",
+    "account_id": "123456789012",
+    "is_multi_region": False,
+    "compliance_frameworks": []
+}
+
+POLICY_DATA = {
+    "shared_resource": False,
+    "revenue_generating": False,
+    "has_rollback": True,
+    "change_window_open": True,
+    "tier": 2,
+    "requires_approval_above_tier": 1,
+    "max_auto_remediate_severity": "MEDIUM"
+}
+
+# DecisionEngine is stateless; share one instance across requests
+_engine = DecisionEngine()
+
+
 # ============================================================================
 # SIMULATE ENDPOINT
 # ============================================================================
@@ -264,88 +336,20 @@ async def simulate_fix(request: SimulateRequest):
     # analysis = await analyze_finding(finding)
 
     # =========================================================================
-    # STEP 1: Run Simulation (mock data for now)
-    # =========================================================================
-
-    simulation_data = {
-        "status": "SAFE",
-        "reachability_preserved": 0.94,
-        "critical_path_affected": False,
-        "worst_path_severity": 0.1,
-        "permissions_tested": 15,
-        "permissions_safe": 14,
-        "services_tested": ["api-gateway", "lambda", "dynamodb"],
-        "warnings": [
-            "External monitoring service may lose read access",
-            "Verify no automated scripts rely on this permission"
-        ]
-    }
-
-    # =========================================================================
-    # STEP 2: Gather Context Data
-    # =========================================================================
-
-    usage_data = {
-        "days_since_last_use": 120,
-        "usage_count_90d": 0,
-        "observation_days": 90,
-        "sources_available": 3,
-        "usage_pattern": "NONE",
-        "last_used_by": None
-    }
-
-    graph_data = {
-        "total_resources": 5,
-        "resources_with_telemetry": 5,
-        "edges_observed": 8,
-        "edges_estimated": 10,
-        "impacted_services": [],
-        "cross_account_dependencies": 0,
-        "circular_dependencies": False
-    }
-
-    history_data = {
-        "total": 23,
-        "successes": 23,
-        "rollbacks": 0,
-        "similar_resource_type_success_rate": 1.0,
-        "last_failure_days_ago": None
-    }
-
-    env_data = {
-        "tier": 2,  # development
-        "region": "us-east-1",
-        "account_id": "123456789012",
-        "is_multi_region": False,
-        "compliance_frameworks": []
-    }
-
-    policy_data = {
-        "shared_resource": False,
-        "revenue_generating": False,
-        "has_rollback": True,
-        "change_window_open": True,
-        "tier": 2,
-        "requires_approval_above_tier": 1,
-        "max_auto_remediate_severity": "MEDIUM"
-    }
-
-    # =========================================================================
-    # STEP 3: Run Decision Engine
+    # STEP 1: Run Decision Engine over the SIMULATE CONTEXT
     # =========================================================================
 
-    engine = DecisionEngine()
-    decision = engine.evaluate(
-        simulation=simulation_data,
-        usage=usage_data,
-        graph=graph_data,
-        history=history_data,
-        env=env_data,
-        policy=policy_data
+    decision = _engine.evaluate(
+        simulation=SIMULATION_DATA,
+        usage=USAGE_DATA,
+        graph=GRAPH_DATA,
+        history=HISTORY_DATA,
+        env=ENV_DATA,
+        policy=POLICY_DATA
     )
 
     # =========================================================================
-    # STEP 4: Build Response
+    # STEP 2: Build Response
     # =========================================================================
 
     # Legacy confidence (0-100 scale)
@@ -391,7 +395,7 @@ async def simulate_fix(request: SimulateRequest):
         temporal_info=temporal_info,
         warnings=decision["warnings"],
         resource_changes=resource_changes,
-        impact_summary=f"1 resource modified. {len(graph_data['impacted_services'])} services affected. Action: {decision['action']}",
+        impact_summary=f"1 resource modified. {len(GRAPH_DATA['impacted_services'])} services affected. Action: {decision['action']}",
         decision=decision_model
     )
 
@@ -416,8 +420,7 @@ async def simulate_with_full_context(
     Use this when you have all context data available from your
     infrastructure analysis.
     """
-    engine = DecisionEngine()
-    decision = engine.evaluate(
+    decision = _engine.evaluate(
         simulation=simulation,
         usage=usage,
         graph=graph,
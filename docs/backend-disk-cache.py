@@ -9,30 +9,280 @@ Mount path: /data (configured in Render dashboard)
 Usage:
 1. Copy this file to your backend
 2. Import and use disk_cache decorator on slow endpoints
-3. Or use DiskCache class directly
+3. Or use get_cache(namespace) for direct get/set/delete
 
 Example:
-    from disk_cache import disk_cache, DiskCache
+    from disk_cache import disk_cache, get_cache
 
     @disk_cache("systems", ttl=300)  # Cache for 5 minutes
     def get_systems():
         return fetch_from_aws()  # Slow call
+
+    cache = get_cache("findings")  # Shared per-process instance
+    cache.set("all-findings", findings, ttl=60)
+    cache.delete("all-findings")  # Invalidate in every worker
 """
 
 import json
+import logging
+import mmap
 import os
+import struct
 import time
+import uuid
 import hashlib
+import shutil
+import threading
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Optional, Callable
+from typing import Any, Dict, Iterator, Optional, Callable, Tuple
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster encoder, returns bytes directly
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd  # Optional: compresses large entries
+except ImportError:
+    zstd = None
+
+logger = logging.getLogger(__name__)
+
 # Render persistent disk mount path
 CACHE_DIR = Path(os.environ.get("CACHE_DIR", "/data/cache"))
 
 # Ensure cache directory exists
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Files between these sizes are mmap'd on read. Below the floor, one read()
+# is cheaper than setting up a mapping; above the ceiling, reading avoids
+# pinning big mappings in the worker's address space.
+MMAP_MIN_BYTES = 64 * 1024
+MMAP_MAX_BYTES = 16 * 1024 * 1024
+
+# Longest a value is served from a worker's in-memory LRU before it is
+# re-read from disk, whatever its TTL (including ttl=0 entries)
+MEM_MAX_AGE_SECONDS = 5
+
+# Per-namespace disk budget. Once usage passes the high watermark, least
+# recently used entries are evicted until it drops below the low watermark.
+# The four built-in namespaces at 128 MB each fill half of the 1 GB Render
+# disk; the rest is headroom for other workers' writes that this worker's
+# index has not picked up yet (see INDEX_RESCAN_SECONDS). Lower it if you
+# add namespaces.
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 128 * 1024 * 1024))
+HIGH_WATERMARK = 0.8
+LOW_WATERMARK = 0.6
+
+# Entries written by other workers only enter this worker's size index on a
+# rescan of the namespace directory
+INDEX_RESCAN_SECONDS = 300
+
+# Rescans delete temp files older than this (left by a crash mid-write),
+# along with .json entries from the pre-.bin format
+TMP_STALE_SECONDS = 60
+LEGACY_SUFFIX = ".json"
+
+# Payloads at least this large are zstd-compressed (level 1) when zstandard
+# is installed. JSON typically shrinks 5-8x, so big blobs cost far fewer
+# bytes of disk bandwidth and page cache.
+COMPRESS_MIN_BYTES = 4 * 1024
+
+# On-disk entry: a fixed 32-byte header, the key, then the encoded value.
+#   magic (4s) | flags (H) | key_len (H) | created_ns (Q) | expires_ns (Q) | value_len (Q)
+# expires_ns == 0 means the entry never expires. Expiry is checked from the
+# header alone, so stale entries are dropped without parsing their value.
+# The stored key is compared on read, so two keys whose 64-bit file name
+# hashes collide read as misses instead of each other's values.
+ENTRY_SUFFIX = ".bin"
+_ENTRY_MAGIC = b"SRDC"
+_HEADER = struct.Struct("<4sHHQQQ")
+FLAG_ZSTD = 0x1
+FLAG_STDJSON = 0x2  # Value written by the json module, not orjson
+_MAX_KEY_BYTES = 0xFFFF
+
+
+_MISSING = object()
+_EXPIRED = object()
+
+
+if orjson is not None:
+    # Datetimes and dataclasses are passed through (and so rejected) rather
+    # than stringified, matching what the json module accepts
+    _ORJSON_OPTS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _dumps(obj: Any) -> Tuple[bytes, int]:
+    """
+    Serialize to compact UTF-8 JSON bytes. Returns (payload, flags).
+
+    orjson is used when available. Values it rejects, such as ints over
+    64 bits, go through the json module instead and are flagged
+    FLAG_STDJSON so they are parsed back with it too.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS), 0
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8"), FLAG_STDJSON
+
+
+def _loads(buf, flags: int = 0) -> Any:
+    """Parse JSON from bytes or any buffer (orjson parses it in place)."""
+    if orjson is not None and not flags & FLAG_STDJSON:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+
+def _encode(value: Any) -> Tuple[bytes, int]:
+    """Serialize a value, compressing it if it is large enough. Returns (payload, flags)."""
+    payload, flags = _dumps(value)
+    if zstd is not None and len(payload) >= COMPRESS_MIN_BYTES:
+        return zstd.ZstdCompressor(level=1).compress(payload), flags | FLAG_ZSTD
+    return payload, flags
+
+
+def _decode(buf, flags: int) -> Any:
+    """
+    Parse a value written by _encode. A compressed value read without
+    zstandard installed is treated as a miss.
+    """
+    if flags & FLAG_ZSTD:
+        if zstd is None:
+            return _MISSING
+        buf = zstd.ZstdDecompressor().decompress(buf)
+    return _loads(buf, flags)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read size bytes from fd, normally in a single read() call."""
+    buf = os.read(fd, size)
+    while len(buf) < size:
+        chunk = os.read(fd, size - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _file_stamp(st: os.stat_result) -> tuple:
+    """Identity of one version of a cache file; changes on every write."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _key_tag(key: str) -> bytes:
+    """Key as stored in an entry; digested if too long for the key_len field."""
+    raw = key.encode()
+    if len(raw) > _MAX_KEY_BYTES:
+        return hashlib.blake2b(raw, digest_size=32).digest()
+    return raw
+
+
+def _read_entry(file_path: Path, key_tag: bytes) -> Tuple[int, Optional[tuple], Any]:
+    """
+    Load a cache file without going through a buffered reader.
+
+    Returns (expires_ns, stamp, value), where stamp is the _file_stamp of
+    the file that was read. value is _EXPIRED if the header says the entry
+    is stale (the value is never read), and _MISSING if the file is
+    truncated, not in this format, stores a different key, or is
+    compressed without zstandard installed. Mid-sized values are parsed
+    straight from the page cache via mmap.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        stamp = _file_stamp(st)
+        # Header and the expected key in one read
+        offset = _HEADER.size + len(key_tag)
+        head = _read_fd(fd, offset)
+        if len(head) < offset:
+            return 0, None, _MISSING
+        magic, flags, key_len, _, expires_ns, value_len = _HEADER.unpack_from(head)
+        if magic != _ENTRY_MAGIC or key_len != len(key_tag) or head[_HEADER.size:] != key_tag:
+            return 0, None, _MISSING
+        if expires_ns and expires_ns < time.time_ns():
+            return expires_ns, None, _EXPIRED
+
+        if MMAP_MIN_BYTES <= value_len <= MMAP_MAX_BYTES:
+            size = offset + value_len
+            if st.st_size < size:
+                return 0, None, _MISSING
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm)[offset:] as view:
+                return expires_ns, stamp, _decode(view, flags)
+        buf = _read_fd(fd, value_len)
+        if len(buf) < value_len:
+            return 0, None, _MISSING
+        return expires_ns, stamp, _decode(buf, flags)
+    finally:
+        os.close(fd)
+
+
+def _walk_files(path: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every file below path (all shards)."""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                else:
+                    yield entry
+    except FileNotFoundError:
+        return  # Removed by a concurrent clear()
+
+
+def _scan_entries(path: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every cache entry file below path (all shards)."""
+    return (entry for entry in _walk_files(path) if entry.name.endswith(ENTRY_SUFFIX))
+
+
+def _atomic_write(file_path: Path, payload: bytes) -> None:
+    """
+    Write payload to a temp file and rename it over file_path.
+
+    Readers in other workers see either the old entry or the new one,
+    never a half-written file.
+    """
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{uuid.uuid4().hex[:8]}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, file_path)
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _args_fingerprint(args: tuple, kwargs: dict) -> str:
+    """
+    Stable text form of a call's arguments for the decorator's cache key.
+    Scalar-only calls use repr (far cheaper than json.dumps); anything else
+    falls back to sorted JSON, so equal dicts built in a different key
+    order share a key.
+    """
+    if all(type(a) in _SCALAR_TYPES for a in args) and \
+            all(type(v) in _SCALAR_TYPES for v in kwargs.values()):
+        return repr(args) + repr(sorted(kwargs.items()))
+    return json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
+
+
+_READ_ERRORS = (json.JSONDecodeError, IOError) + ((zstd.ZstdError,) if zstd else ())
+
 
 class DiskCache:
     """
@@ -43,19 +293,202 @@ class DiskCache:
     - Shared across all instances
     - Fast read/write (SSD-backed)
     - No external dependencies (no Redis needed)
+
+    Hot keys are also kept in a small per-process LRU (mem_capacity entries)
+    so repeat reads skip reading and decoding the file. Only values decoded
+    from disk enter it, so a get always returns what the file holds, never
+    the object a caller passed to set. A memory hit is
+    only served while the file on disk is still the one it was read from
+    (checked with one stat()), so a delete, set or clear from any worker,
+    instance or the CLI takes effect on the next get. Copies are also
+    dropped after MEM_MAX_AGE_SECONDS. Values served from memory are
+    shared, so treat them as read-only.
+
+    Prefer get_cache(namespace) over constructing DiskCache directly, so
+    each process shares one instance per namespace.
+
+    Disk usage is bounded by max_bytes (CACHE_MAX_BYTES by default): entries
+    are tracked in LRU order and the coldest are evicted when the namespace
+    grows past its high watermark.
     """
 
-    def __init__(self, namespace: str = "default"):
+    def __init__(
+        self,
+        namespace: str = "default",
+        mem_capacity: int = 256,
+        max_bytes: Optional[int] = None,
+    ):
         self.namespace = namespace
         self.cache_path = CACHE_DIR / namespace
         self.cache_path.mkdir(parents=True, exist_ok=True)
 
+        # key -> (evict_ns, file stamp, value)
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self._mem_capacity = mem_capacity
+        self._mem_lock = threading.Lock()
+
+        # file path -> size in bytes, least recently used first
+        self.max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_scanned_at = 0.0
+        # While a background rescan runs, writes (path -> size) and deletes
+        # (path -> None) are recorded here and applied over its result
+        self._disk_rescanning = False
+        self._disk_changes: Dict[str, Optional[int]] = {}
+        self._disk_lock = threading.Lock()
+        self._rebuild_disk_index()
+
+    def _mem_get(self, key: str) -> Optional[tuple]:
+        """Return (file stamp, value) for a live memory copy, else None."""
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            evict_ns, stamp, value = entry
+            if evict_ns < time.time_ns():
+                del self._mem[key]
+                return None
+            self._mem.move_to_end(key)
+            return stamp, value
+
+    def _mem_put(self, key: str, expires_ns: int, stamp: tuple, value: Any) -> None:
+        if self._mem_capacity <= 0:
+            return
+        evict_ns = time.time_ns() + MEM_MAX_AGE_SECONDS * 1_000_000_000
+        if expires_ns:
+            evict_ns = min(evict_ns, expires_ns)
+        with self._mem_lock:
+            self._mem[key] = (evict_ns, stamp, value)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_capacity:
+                self._mem.popitem(last=False)
+
+    def _mem_discard(self, key: str) -> None:
+        with self._mem_lock:
+            self._mem.pop(key, None)
+
+    def _rebuild_disk_index(self) -> None:
+        """
+        Rebuild the size/LRU index from the namespace directory in one
+        scandir pass over the shards. Files seen for the first time are
+        ordered by mtime; entries this worker already tracks keep their
+        relative order, and changes made while the scan ran win over it.
+
+        The same pass deletes legacy .json entries and stale temp files,
+        which would otherwise sit on the disk outside the size budget.
+        """
+        scanned = []
+        swept = 0
+        stale_before = time.time() - TMP_STALE_SECONDS
+        for entry in _walk_files(self.cache_path):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            name = entry.name
+            if name.endswith(ENTRY_SUFFIX):
+                scanned.append((st.st_mtime, entry.path, st.st_size))
+            elif name.endswith(LEGACY_SUFFIX) or (".tmp." in name and st.st_mtime < stale_before):
+                try:
+                    os.unlink(entry.path)
+                    swept += 1
+                except FileNotFoundError:
+                    pass
+        scanned.sort()
+        if swept:
+            logger.info("[DiskCache] Removed %d stale files from %s", swept, self.namespace)
+
+        with self._disk_lock:
+            index = OrderedDict((path, size) for _, path, size in scanned)
+            for path in self._disk:
+                if path in index:
+                    index.move_to_end(path)
+            for path, size in self._disk_changes.items():
+                if size is None:
+                    index.pop(path, None)
+                else:
+                    index[path] = size
+                    index.move_to_end(path)
+            self._disk_changes = {}
+            self._disk = index
+            self._disk_bytes = sum(index.values())
+            self._disk_scanned_at = time.monotonic()
+
+    def _disk_touch(self, path: str) -> None:
+        with self._disk_lock:
+            if path in self._disk:
+                self._disk.move_to_end(path)
+
+    def _disk_discard(self, path: str) -> None:
+        with self._disk_lock:
+            self._disk_bytes -= self._disk.pop(path, 0)
+            if self._disk_rescanning:
+                self._disk_changes[path] = None
+
+    def _background_rescan(self) -> None:
+        try:
+            self._rebuild_disk_index()
+        except OSError as e:
+            logger.warning("[DiskCache] Rescan of %s failed: %s", self.namespace, e)
+        finally:
+            with self._disk_lock:
+                self._disk_rescanning = False
+                self._disk_changes = {}
+                self._disk_scanned_at = time.monotonic()
+
+    def _disk_track_write(self, path: str, size: int) -> None:
+        with self._disk_lock:
+            self._disk_bytes += size - self._disk.pop(path, 0)
+            self._disk[path] = size
+            if self._disk_rescanning:
+                self._disk_changes[path] = size
+
+            # The periodic rescan walks and stats the whole namespace, so it
+            # runs on a background thread rather than in this set() call
+            rescan = (
+                not self._disk_rescanning
+                and time.monotonic() - self._disk_scanned_at > INDEX_RESCAN_SECONDS
+            )
+            if rescan:
+                self._disk_rescanning = True
+
+            victims = []
+            if self._disk_bytes > self.max_bytes * HIGH_WATERMARK:
+                low = self.max_bytes * LOW_WATERMARK
+                # Never evict the entry being written (it is the most
+                # recently used, so this only stops an emptied index)
+                while self._disk_bytes > low and next(iter(self._disk)) != path:
+                    victim, victim_size = self._disk.popitem(last=False)
+                    self._disk_bytes -= victim_size
+                    victims.append(victim)
+                    if self._disk_rescanning:
+                        self._disk_changes[victim] = None
+
+        if rescan:
+            threading.Thread(
+                target=self._background_rescan,
+                name=f"disk-cache-rescan-{self.namespace}",
+                daemon=True,
+            ).start()
+        if not victims:
+            return
+
+        for victim in victims:
+            try:
+                os.unlink(victim)
+            except FileNotFoundError:
+                pass
+        logger.info("[DiskCache] Evicted %d entries from %s", len(victims), self.namespace)
+
     def _get_file_path(self, key: str) -> Path:
-        """Get cache file path for a key."""
-        # Hash long keys to avoid filesystem issues
-        if len(key) > 100:
-            key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_path / f"{key}.json"
+        """
+        Get cache file path for a key. Keys are hashed and spread over two
+        levels of 256 shard directories so no directory grows large enough
+        to slow down lookups or listings.
+        """
+        h = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return self.cache_path / h[:2] / h[2:4] / f"{h}{ENTRY_SUFFIX}"
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -63,21 +496,35 @@ class DiskCache:
         """
         file_path = self._get_file_path(key)
 
-        if not file_path.exists():
-            return default
+        cached = self._mem_get(key)
+        if cached is not None:
+            # Only trust the copy while the file is the version it came from
+            try:
+                stamp = _file_stamp(os.stat(file_path))
+            except FileNotFoundError:
+                self._mem_discard(key)
+                return default
+            if stamp == cached[0]:
+                self._disk_touch(os.fspath(file_path))
+                return cached[1]
 
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-
-            # Check expiration
-            if data.get("expires_at") and data["expires_at"] < time.time():
-                file_path.unlink()  # Delete expired cache
+            # No exists() probe: a failed open is the miss signal
+            expires_ns, stamp, value = _read_entry(file_path, _key_tag(key))
+            if value is _EXPIRED:
+                file_path.unlink(missing_ok=True)  # Delete expired cache
+                self._disk_discard(os.fspath(file_path))
+                return default
+            if value is _MISSING:
                 return default
 
-            return data.get("value", default)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[DiskCache] Error reading {key}: {e}")
+            self._mem_put(key, expires_ns, stamp, value)
+            self._disk_touch(os.fspath(file_path))
+            return value
+        except FileNotFoundError:
+            return default
+        except _READ_ERRORS as e:
+            logger.warning("[DiskCache] Error reading %s: %s", key, e)
             return default
 
     def set(self, key: str, value: Any, ttl: int = 300) -> bool:
@@ -88,57 +535,113 @@ class DiskCache:
         file_path = self._get_file_path(key)
 
         try:
-            data = {
-                "value": value,
-                "created_at": time.time(),
-                "expires_at": time.time() + ttl if ttl > 0 else None,
-                "ttl": ttl
-            }
-
-            with open(file_path, "w") as f:
-                json.dump(data, f)
-
+            created_ns = time.time_ns()
+            expires_ns = created_ns + int(ttl * 1_000_000_000) if ttl > 0 else 0
+
+            body, flags = _encode(value)
+            key_tag = _key_tag(key)
+            header = _HEADER.pack(_ENTRY_MAGIC, flags, len(key_tag), created_ns, expires_ns, len(body))
+            # One write() of the whole entry
+            payload = header + key_tag + body
+            if len(payload) > self.max_bytes * LOW_WATERMARK:
+                # Storing it would evict everything else, then itself
+                logger.warning(
+                    "[DiskCache] Not caching %s: %d bytes exceeds the %s budget",
+                    key, len(payload), self.namespace,
+                )
+                # Drop the previous value too, or get() would keep serving it
+                self.delete(key)
+                return False
+            try:
+                _atomic_write(file_path, payload)
+            except FileNotFoundError:
+                # Shard directories are created on first write
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(file_path, payload)
+
+            # The next get fills memory from the file, so callers always get
+            # the decoded value rather than the object they passed in
+            self._mem_discard(key)
+            self._disk_track_write(os.fspath(file_path), len(payload))
             return True
         except (IOError, TypeError) as e:
-            print(f"[DiskCache] Error writing {key}: {e}")
+            logger.warning("[DiskCache] Error writing %s: %s", key, e)
+            # A failed set must not leave the previous value being served
+            try:
+                self.delete(key)
+            except OSError:
+                pass
             return False
 
     def delete(self, key: str) -> bool:
         """Delete a cached value."""
+        self._mem_discard(key)
         file_path = self._get_file_path(key)
+        self._disk_discard(os.fspath(file_path))
 
-        if file_path.exists():
+        try:
             file_path.unlink()
             return True
-        return False
+        except FileNotFoundError:
+            return False
 
     def clear(self) -> int:
         """Clear all cached values in this namespace. Returns count deleted."""
-        count = 0
-        for file_path in self.cache_path.glob("*.json"):
-            file_path.unlink()
-            count += 1
+        with self._mem_lock:
+            self._mem.clear()
+        with self._disk_lock:
+            self._disk.clear()
+            self._disk_bytes = 0
+        count = sum(1 for _ in _scan_entries(self.cache_path))
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+        self.cache_path.mkdir(parents=True, exist_ok=True)
         return count
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        files = list(self.cache_path.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
+        # On Linux DirEntry.stat() is still one stat() per file (only Windows
+        # fills it from the listing); scandir saves building a Path per file,
+        # and is_dir() while walking shards comes from d_type with no syscall
+        entries = 0
+        total_size = 0
+        for entry in _scan_entries(self.cache_path):
+            try:
+                total_size += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue
+            entries += 1
 
         return {
             "namespace": self.namespace,
-            "entries": len(files),
+            "entries": entries,
             "size_bytes": total_size,
             "size_mb": round(total_size / (1024 * 1024), 2),
             "path": str(self.cache_path)
         }
 
 
+# One DiskCache per namespace per process, so every caller shares the same
+# in-memory LRU and nobody re-runs mkdir
+_cache_registry: Dict[str, DiskCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(namespace: str) -> DiskCache:
+    """Return the shared DiskCache for a namespace, creating it on first use."""
+    cache = _cache_registry.get(namespace)
+    if cache is None:
+        with _registry_lock:
+            cache = _cache_registry.get(namespace)
+            if cache is None:
+                cache = _cache_registry[namespace] = DiskCache(namespace)
+    return cache
+
+
 # Global cache instances for common use cases
-systems_cache = DiskCache("systems")
-findings_cache = DiskCache("findings")
-gap_cache = DiskCache("gap-analysis")
-graph_cache = DiskCache("graph")
+systems_cache = get_cache("systems")
+findings_cache = get_cache("findings")
+gap_cache = get_cache("gap-analysis")
+graph_cache = get_cache("graph")
 
 
 def disk_cache(namespace: str, ttl: int = 300, key_fn: Optional[Callable] = None):
@@ -159,7 +662,7 @@ def disk_cache(namespace: str, ttl: int = 300, key_fn: Optional[Callable] = None
         def get_findings_for_system(system_name: str):
             return fetch_findings(system_name)
     """
-    cache = DiskCache(namespace)
+    cache = get_cache(namespace)
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -169,16 +672,16 @@ def disk_cache(namespace: str, ttl: int = 300, key_fn: Optional[Callable] = None
                 cache_key = key_fn(*args, **kwargs)
             else:
                 # Default: use function name + args hash
-                args_str = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
-                cache_key = f"{func.__name__}-{hashlib.md5(args_str.encode()).hexdigest()[:8]}"
+                args_str = _args_fingerprint(args, kwargs)
+                cache_key = f"{func.__name__}-{hashlib.blake2b(args_str.encode(), digest_size=8).hexdigest()}"
 
             # Try to get from cache
             cached = cache.get(cache_key)
             if cached is not None:
-                print(f"[DiskCache] HIT: {namespace}/{cache_key}")
+                logger.debug("[DiskCache] HIT: %s/%s", namespace, cache_key)
                 return cached
 
-            print(f"[DiskCache] MISS: {namespace}/{cache_key}")
+            logger.debug("[DiskCache] MISS: %s/%s", namespace, cache_key)
 
             # Call function and cache result
             result = func(*args, **kwargs)
@@ -258,7 +761,7 @@ async def warm_cache():
     Pre-populate cache on startup to avoid cold-start delays.
     Call this from your app startup or a background job.
     """
-    print("[DiskCache] Warming cache...")
+    logger.info("[DiskCache] Warming cache...")
 
     # Import your actual data fetching functions here
     # from your_app import fetch_systems, fetch_findings, fetch_gap_analysis
@@ -270,7 +773,7 @@ async def warm_cache():
     # findings = await fetch_findings()
     # findings_cache.set("all-findings", findings, ttl=300)
 
-    print("[DiskCache] Cache warmed!")
+    logger.info("[DiskCache] Cache warmed!")
 
 
 # ============================================================================
@@ -289,25 +792,26 @@ if __name__ == "__main__":
 
     if command == "stats":
         for name in ["systems", "findings", "gap-analysis", "graph"]:
-            cache = DiskCache(name)
+            cache = get_cache(name)
             stats = cache.get_stats()
             print(f"{name}: {stats['entries']} entries, {stats['size_mb']} MB")
 
     elif command == "clear":
         namespace = sys.argv[2] if len(sys.argv) > 2 else None
         if namespace:
-            cache = DiskCache(namespace)
+            cache = get_cache(namespace)
             count = cache.clear()
             print(f"Cleared {count} entries from {namespace}")
         else:
             total = 0
             for name in ["systems", "findings", "gap-analysis", "graph"]:
-                cache = DiskCache(name)
+                cache = get_cache(name)
                 total += cache.clear()
             print(f"Cleared {total} entries from all namespaces")
 
     elif command == "warm":
         import asyncio
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
         asyncio.run(warm_cache())
 
     else: